@@ -19,7 +19,9 @@ class FlyScanParameters(Device):
     scan_time = Component(EpicsSignal, "usxLAX:USAXS:FS_ScanTime")
     use_flyscan = Component(EpicsSignal, "usxLAX:USAXS:UseFlyscan")
     # asrp_calc_SCAN = Component(EpicsSignal, "usxLAX:userStringCalc2.SCAN")
-    order_number = Component(EpicsSignal, "usxLAX:USAXS:FS_OrderNumber")
+    order_number = Component(
+        EpicsSignal, "usxLAX:USAXS:FS_OrderNumber", auto_monitor=True
+    )
     elapsed_time = Component(EpicsSignal, "usxLAX:USAXS:FS_ElapsedTime")
 
     setpoint_up = Component(Signal, value=6000)  # decrease range
@@ -120,15 +122,15 @@ class Parameters_transmission(Device):
 class Parameters_USAXS(Device):
     """Internal values shared with EPICS for USAXS operations."""
 
-    AX0 = Component(EpicsSignal, "usxLAX:ax_in")
-    DX0 = Component(EpicsSignal, "usxLAX:USAXS:Diode_dx")
+    AX0 = Component(EpicsSignal, "usxLAX:ax_in", auto_monitor=True)
+    DX0 = Component(EpicsSignal, "usxLAX:USAXS:Diode_dx", auto_monitor=True)
     ASRP0 = Component(EpicsSignal, "usxLAX:USAXS:ASRcenter")
     SAD = Component(EpicsSignal, "usxLAX:USAXS:SAD")
     SDD = Component(EpicsSignal, "usxLAX:USAXS:SDD")
     ar_val_center = Component(EpicsSignal, "usxLAX:USAXS:ARcenter")
 
-    ay_in = Component(EpicsSignal, "usxLAX:ay_in")
-    dy_in = Component(EpicsSignal, "usxLAX:USAXS:Diode_dy")
+    ay_in = Component(EpicsSignal, "usxLAX:ay_in", auto_monitor=True)
+    dy_in = Component(EpicsSignal, "usxLAX:USAXS:Diode_dy", auto_monitor=True)
     ax_in = Component(EpicsSignal, "usxLAX:ax_in")
     ax_out = Component(EpicsSignal, "usxLAX:ax_out")
     dx_in = Component(EpicsSignal, "usxLAX:USAXS:Diode_dx")
@@ -154,10 +156,10 @@ class Parameters_USAXS(Device):
     useDynamicTime = Component(Signal, value=True)
     useMSstage = Component(Signal, value=False)
     useSBUSAXS = Component(Signal, value=False)
-    guard_h_size = Component(EpicsSignal, "usxLAX:USAXS_hgslit_ap")
-    guard_v_size = Component(EpicsSignal, "usxLAX:USAXS_vgslit_ap")
-    usaxs_h_size = Component(EpicsSignal, "usxLAX:USAXS_hslit_ap")
-    usaxs_v_size = Component(EpicsSignal, "usxLAX:USAXS_vslit_ap")
+    guard_h_size = Component(EpicsSignal, "usxLAX:USAXS_hgslit_ap", auto_monitor=True)
+    guard_v_size = Component(EpicsSignal, "usxLAX:USAXS_vgslit_ap", auto_monitor=True)
+    usaxs_h_size = Component(EpicsSignal, "usxLAX:USAXS_hslit_ap", auto_monitor=True)
+    usaxs_v_size = Component(EpicsSignal, "usxLAX:USAXS_vslit_ap", auto_monitor=True)
 
     retune_needed = Component(Signal, value=False)  # does not *need* an EPICS PV
 
@@ -177,20 +179,20 @@ class Parameters_SBUSAXS(Device):
 class Parameters_SAXS(Device):
     """Parameters for SAXS operations."""
 
-    z_in = Component(EpicsSignal, "usxLAX:SAXS_z_in")
-    z_out = Component(EpicsSignal, "usxLAX:SAXS_z_out")
+    z_in = Component(EpicsSignal, "usxLAX:SAXS_z_in", auto_monitor=True)
+    z_out = Component(EpicsSignal, "usxLAX:SAXS_z_out", auto_monitor=True)
     z_limit_offset = Component(EpicsSignal, "usxLAX:SAXS_z_limit_offset")
 
     x_in = Component(EpicsSignal, "usxLAX:SAXS_x_in")
 
-    y_in = Component(EpicsSignal, "usxLAX:SAXS_y_in")
-    y_out = Component(EpicsSignal, "usxLAX:SAXS_y_out")
+    y_in = Component(EpicsSignal, "usxLAX:SAXS_y_in", auto_monitor=True)
+    y_out = Component(EpicsSignal, "usxLAX:SAXS_y_out", auto_monitor=True)
     y_limit_offset = Component(EpicsSignal, "usxLAX:SAXS_y_limit_offset")
 
     ay_in = Component(EpicsSignal, "usxLAX:ay_in")
 
     ax_in = Component(EpicsSignal, "usxLAX:ax_in")
-    ax_out = Component(EpicsSignal, "usxLAX:ax_out")
+    ax_out = Component(EpicsSignal, "usxLAX:ax_out", auto_monitor=True)
     ax_limit_offset = Component(EpicsSignal, "usxLAX:ax_limit_offset")
 
     dy_in = Component(EpicsSignal, "usxLAX:USAXS:Diode_dy")
@@ -198,25 +200,25 @@ class Parameters_SAXS(Device):
     dx_in = Component(
         EpicsSignal, "usxLAX:USAXS:Diode_dx"
     )  # deprecated, do not use, use USAXS:Diode.dx
-    dx_out = Component(EpicsSignal, "usxLAX:USAXS:Diode_dx_out")
+    dx_out = Component(EpicsSignal, "usxLAX:USAXS:Diode_dx_out", auto_monitor=True)
     dx_limit_offset = Component(EpicsSignal, "usxLAX:USAXS:Diode_dx_limit_offset")
 
     usaxs_h_size = Component(EpicsSignal, "usxLAX:USAXS_hslit_ap")
     usaxs_v_size = Component(EpicsSignal, "usxLAX:USAXS_vslit_ap")
-    v_size = Component(EpicsSignal, "usxLAX:SAXS_vslit_ap")
-    h_size = Component(EpicsSignal, "usxLAX:SAXS_hslit_ap")
+    v_size = Component(EpicsSignal, "usxLAX:SAXS_vslit_ap", auto_monitor=True)
+    h_size = Component(EpicsSignal, "usxLAX:SAXS_hslit_ap", auto_monitor=True)
 
     usaxs_guard_h_size = Component(EpicsSignal, "usxLAX:USAXS_hgslit_ap")
     usaxs_guard_v_size = Component(EpicsSignal, "usxLAX:USAXS_vgslit_ap")
-    guard_v_size = Component(EpicsSignal, "usxLAX:SAXS_vgslit_ap")
-    guard_h_size = Component(EpicsSignal, "usxLAX:SAXS_hgslit_ap")
+    guard_v_size = Component(EpicsSignal, "usxLAX:SAXS_vgslit_ap", auto_monitor=True)
+    guard_h_size = Component(EpicsSignal, "usxLAX:SAXS_hgslit_ap", auto_monitor=True)
 
     filters = Component(Parameters_Al_Ti_Filters, "usxLAX:SAXS:Exp_")
 
     base_dir = Component(EpicsSignal, "usxLAX:directory", string=True)
 
     UsaxsSaxsMode = Component(
-        EpicsSignal, "usxLAX:SAXS:USAXSSAXSMode", put_complete=True
+        EpicsSignal, "usxLAX:SAXS:USAXSSAXSMode", put_complete=True, auto_monitor=True
     )
     num_images = Component(EpicsSignal, "usxLAX:SAXS:NumImages")
     acquire_time = Component(EpicsSignal, "usxLAX:SAXS:AcquireTime")
@@ -241,8 +243,8 @@ class Parameters_SAXS_WAXS(Device):
 class Parameters_WAXS(Device):
     """Parameters for WAXS operations."""
 
-    x_in = Component(EpicsSignal, "usxLAX:WAXS_x_in")
-    x_out = Component(EpicsSignal, "usxLAX:WAXS_x_out")
+    x_in = Component(EpicsSignal, "usxLAX:WAXS_x_in", auto_monitor=True)
+    x_out = Component(EpicsSignal, "usxLAX:WAXS_x_out", auto_monitor=True)
     x_limit_offset = Component(EpicsSignal, "usxLAX:WAXS_x_limit_offset")
     filters = Component(Parameters_Al_Ti_Filters, "usxLAX:WAXS:Exp_")
     base_dir = Component(EpicsSignal, "usxLAX:directory", string=True)
@@ -3,13 +3,10 @@ plans to control the beam filters
 """
 
 import logging
-from typing import Union
 
 from apsbits.core.instrument_init import oregistry
-from apsbits.utils.config_loaders import get_config
 from bluesky import plan_stubs as bps
 from bluesky.utils import plan
-from ophyd.scaler import ScalerCH
 
 logger = logging.getLogger(__name__)
 
@@ -20,22 +17,15 @@ terms = oregistry["terms"]
 monochromator = oregistry["monochromator"]
 user_data = oregistry["user_data"]
 
-iconfig = get_config()
-scaler0_name = iconfig.get("SCALER_PV_NAMES", {}).get("SCALER0_NAME")
-
-scaler0 = ScalerCH(scaler0_name, name="scaler0")
-scaler0.stage_sigs["count_mode"] = "OneShot"
-scaler0.select_channels()
-
 
 @plan
-def _insertFilters_(a: Union[int, float]):
+def _insertFilters_(a: int | float):
     """
     Plan: insert the EPICS-specified filters.
 
     Parameters
     ----------
-    a : Union[int, float]
+    a : int | float
         The filter position to set
 
     Returns
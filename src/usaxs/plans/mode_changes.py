@@ -9,10 +9,8 @@ import datetime
 import logging
 
 from apsbits.core.instrument_init import oregistry
-from apsbits.utils.config_loaders import get_config
 from apstools.devices import SCALER_AUTOCOUNT_MODE
 from bluesky import plan_stubs as bps
-from ophyd.scaler import ScalerCH
 
 from .filter_plans import insertBlackflyFilters
 from .filter_plans import insertRadiographyFilters
@@ -28,6 +26,17 @@ from .move_instrument import move_WAXSOut
 
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "confirm_instrument_mode",
+    "mode_DirectBeam",
+    "mode_Imaging",
+    "mode_OpenBeamPath",
+    "mode_Radiography",
+    "mode_SAXS",
+    "mode_SBUSAXS",
+    "mode_USAXS",
+    "mode_WAXS",
+]
 
 terms = oregistry["terms"]
 user_data = oregistry["user_data"]
@@ -42,13 +51,8 @@ usaxs_slit = oregistry["usaxs_slit"]
 diagnostics = oregistry["diagnostics"]
 mono_shutter = oregistry["mono_shutter"]
 monochromator = oregistry["monochromator"]
-
-
-iconfig = get_config()
-scaler0_name = iconfig.get("SCALER_PV_NAMES", {}).get("SCALER0_NAME")
-
-scaler0 = ScalerCH(scaler0_name, name="scaler0")
-scaler0.stage_sigs["count_mode"] = "OneShot"
+# stage_sigs (count_mode=OneShot) are installed once by setup_scalers()
+scaler0 = oregistry["scaler0"]
 
 NUM_AUTORANGE_GAINS = 5  # common to all autorange sequence programs
 AMPLIFIER_MINIMUM_SETTLING_TIME = 0.01  # reasonable?
@@ -67,6 +71,27 @@ def confirm_instrument_mode(mode_name):
     return terms.SAXS.UsaxsSaxsMode.get() in (expected_mode, mode_name)
 
 
+def _record_mode_change(*args):
+    """
+    Plan: stamp the mode-change time in EPICS and clear ``scanning``.
+
+    Any additional ``(signal, value)`` pairs in ``args`` are set in the
+    same ``bps.mv()`` call.
+    """
+    ts = str(datetime.datetime.now())
+    yield from bps.mv(
+        # fmt: off
+        user_data.time_stamp,
+        ts,
+        user_data.macro_file_time,
+        ts,
+        user_data.scanning,
+        0,
+        *args,
+        # fmt: on
+    )
+
+
 # #def mode_Laser(md=None):
 #     """
 #     Sets to Laser distance meter mode, using AR500 laser.
@@ -93,23 +118,23 @@ def mode_DirectBeam(md=None):
     yield from MONO_FEEDBACK_ON()
     yield from user_data.set_state_plan("Preparing for BlackFly imaging mode")
 
-    yield from bps.mv(
+    # Start the stage moves without waiting, insert the filters
+    # (different hardware) while they move, then wait for everything.
+    group = "mode_DirectBeam"
+    for obj, value in (
         # fmt: off
-        # laser.enable,  0,
-        d_stage.x,
-        terms.USAXS.blackfly.dx.get(),
-        d_stage.y,
-        terms.USAXS.blackfly.dy.get(),
-        m_stage.x,
-        -200,
-        a_stage.x,
-        -200,
-        gslit_stage.x,
-        0,
+        # (laser.enable, 0),
+        (d_stage.x, terms.USAXS.blackfly.dx.get()),
+        (d_stage.y, terms.USAXS.blackfly.dy.get()),
+        (m_stage.x, -200),
+        (a_stage.x, -200),
+        (gslit_stage.x, 0),
         # fmt: on
-    )
+    ):
+        yield from bps.abs_set(obj, value, group=group)
 
     yield from insertBlackflyFilters()
+    yield from bps.wait(group=group)
     yield from bps.mv(
         # fmt: off
         usaxs_shutter,
@@ -120,15 +145,8 @@ def mode_DirectBeam(md=None):
     yield from user_data.set_state_plan(
         "Ready for BlackFly direct beam visualization mode"
     )
-    ts = str(datetime.datetime.now())
-    yield from bps.mv(
+    yield from _record_mode_change(
         # fmt: off
-        user_data.time_stamp,
-        ts,
-        user_data.macro_file_time,
-        ts,
-        user_data.scanning,
-        0,
         user_data.collection_in_progress,
         0,
         blackfly_det.cam.acquire,
@@ -138,7 +156,7 @@ def mode_DirectBeam(md=None):
     )
 
 
-def mode_USAXS(md=None):
+def mode_USAXS(md=None, force=False):
     """
     Set the instrument to USAXS mode.
 
@@ -146,6 +164,9 @@ def mode_USAXS(md=None):
     ----------
     md : dict, optional
         Metadata dictionary for the scan.
+    force : bool, optional
+        If True, move the instrument components even when
+        ``UsaxsSaxsMode`` already reports this mode.  (default: False)
     """
     yield from user_data.set_state_plan("Moving USAXS to USAXS mode")
 
@@ -160,9 +181,10 @@ def mode_USAXS(md=None):
 
     # retune_needed = False
 
-    if not confirm_instrument_mode("USAXS in beam"):
-        mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
-        logger.debug(f"Found UsaxsSaxsMode = {mode_now}")
+    if force or not confirm_instrument_mode("USAXS in beam"):
+        if logger.isEnabledFor(logging.DEBUG):
+            mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
+            logger.debug("Found UsaxsSaxsMode = %s", mode_now)
         logger.info("Moving to USAXS mode ... please wait ...")
         yield from move_WAXSOut()
         yield from move_SAXSOut()
@@ -201,17 +223,7 @@ def mode_USAXS(md=None):
 
     logger.debug("Prepared for USAXS mode")
     yield from user_data.set_state_plan("USAXS Mode")
-    ts = str(datetime.datetime.now())
-    yield from bps.mv(
-        # fmt: off
-        user_data.time_stamp,
-        ts,
-        user_data.macro_file_time,
-        ts,
-        user_data.scanning,
-        0,
-        # fmt: on
-    )
+    yield from _record_mode_change()
 
     # #if retune_needed:
     #     # don't tune here
@@ -223,7 +235,7 @@ def mode_USAXS(md=None):
 mode_SBUSAXS = mode_USAXS  # for now
 
 
-def mode_SAXS(md=None):
+def mode_SAXS(md=None, force=False):
     """
     Set the instrument to SAXS mode.
 
@@ -231,6 +243,9 @@ def mode_SAXS(md=None):
     ----------
     md : dict, optional
         Metadata dictionary for the scan.
+    force : bool, optional
+        If True, move the instrument components even when
+        ``UsaxsSaxsMode`` already reports this mode.  (default: False)
     """
     yield from user_data.set_state_plan("Moving USAXS to SAXS mode")
 
@@ -246,9 +261,10 @@ def mode_SAXS(md=None):
         # fmt: on
     )
 
-    if not confirm_instrument_mode("SAXS in beam"):
-        mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
-        logger.debug(f"Found UsaxsSaxsMode = {mode_now}")
+    if force or not confirm_instrument_mode("SAXS in beam"):
+        if logger.isEnabledFor(logging.DEBUG):
+            mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
+            logger.debug("Found UsaxsSaxsMode = %s", mode_now)
         logger.info("Moving to SAXS mode ... please wait ...")
         yield from move_WAXSOut()
         yield from move_USAXSOut()
@@ -257,20 +273,10 @@ def mode_SAXS(md=None):
     logger.debug("Prepared for SAXS mode")
     # insertScanFilters
     yield from user_data.set_state_plan("SAXS Mode")
-    ts = str(datetime.datetime.now())
-    yield from bps.mv(
-        # fmt: off
-        user_data.time_stamp,
-        ts,
-        user_data.macro_file_time,
-        ts,
-        user_data.scanning,
-        0,
-        # fmt: on
-    )
+    yield from _record_mode_change()
 
 
-def mode_WAXS(md=None):
+def mode_WAXS(md=None, force=False):
     """
     Set the instrument to WAXS mode.
 
@@ -278,6 +284,9 @@ def mode_WAXS(md=None):
     ----------
     md : dict, optional
         Metadata dictionary for the scan.
+    force : bool, optional
+        If True, move the instrument components even when
+        ``UsaxsSaxsMode`` already reports this mode.  (default: False)
     """
     yield from user_data.set_state_plan("Moving USAXS to WAXS mode")
 
@@ -293,11 +302,12 @@ def mode_WAXS(md=None):
         # fmt: on
     )
 
-    if confirm_instrument_mode("WAXS in beam"):
+    if not force and confirm_instrument_mode("WAXS in beam"):
         logger.debug("WAXS is in beam")
     else:
-        mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
-        logger.debug(f"Found UsaxsSaxsMode = {mode_now}")
+        if logger.isEnabledFor(logging.DEBUG):
+            mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
+            logger.debug("Found UsaxsSaxsMode = %s", mode_now)
         logger.info("Moving to WAXS mode ... please wait ...")
         yield from move_SAXSOut()
         yield from move_USAXSOut()
@@ -306,17 +316,7 @@ def mode_WAXS(md=None):
     logger.debug("Prepared for WAXS mode")
     # insertScanFilters
     yield from user_data.set_state_plan("WAXS Mode")
-    ts = str(datetime.datetime.now())
-    yield from bps.mv(
-        # fmt: off
-        user_data.time_stamp,
-        ts,
-        user_data.macro_file_time,
-        ts,
-        user_data.scanning,
-        0,
-        # fmt: on
-    )
+    yield from _record_mode_change()
 
 
 def mode_Radiography(md=None):
@@ -334,42 +334,32 @@ def mode_Radiography(md=None):
 
     yield from MONO_FEEDBACK_ON()
 
-    yield from bps.mv(
+    # Start the stage & slit moves without waiting, insert the filters
+    # (different hardware) while they move, then wait for everything.
+    group = "mode_Radiography"
+    for obj, value in (
         # fmt: off
+        (user_data.collection_in_progress, 1),
         # move to ccd position
-        user_data.collection_in_progress,
-        1,
-        d_stage.x,
-        terms.USAXS.ccd.dx.get(),
-        d_stage.y,
-        terms.USAXS.ccd.dy.get(),
+        (d_stage.x, terms.USAXS.ccd.dx.get()),
+        (d_stage.y, terms.USAXS.ccd.dy.get()),
         # make sure slits are in place
-        usaxs_slit.v_size,
-        terms.SAXS.usaxs_v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.usaxs_h_size.get(),
-        guard_slit.v_size,
-        terms.SAXS.usaxs_guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.usaxs_guard_h_size.get(),
+        (usaxs_slit.v_size, terms.SAXS.usaxs_v_size.get()),
+        (usaxs_slit.h_size, terms.SAXS.usaxs_h_size.get()),
+        (guard_slit.v_size, terms.SAXS.usaxs_guard_v_size.get()),
+        (guard_slit.h_size, terms.SAXS.usaxs_guard_h_size.get()),
         # fmt: on
-    )
+    ):
+        yield from bps.abs_set(obj, value, group=group)
 
     yield from insertRadiographyFilters()
+    yield from bps.wait(group=group)
 
     # when all that is complete, then ...
-    ts = str(datetime.datetime.now())
-    yield from bps.mv(
+    yield from _record_mode_change(
         # fmt: off
         usaxs_shutter,
         "open",
-        # usaxs_shutter, "open",
-        user_data.time_stamp,
-        ts,
-        user_data.macro_file_time,
-        ts,
-        user_data.scanning,
-        0,
         user_data.collection_in_progress,
         0,
         blackfly_det.cam.acquire,
@@ -426,7 +416,7 @@ def mode_Imaging(md=None):
     yield from mode_USAXS()
 
 
-def mode_OpenBeamPath(md=None):
+def mode_OpenBeamPath(md=None, force=False):
     """
     Set the instrument to Open Beam Path mode.
 
@@ -434,6 +424,9 @@ def mode_OpenBeamPath(md=None):
     ----------
     md : dict, optional
         Metadata dictionary for the scan.
+    force : bool, optional
+        If True, move the instrument components even when
+        ``UsaxsSaxsMode`` already reports this mode.  (default: False)
     """
     yield from user_data.set_state_plan("Moving USAXS to OpenBeamPath mode")
     yield from bps.mv(
@@ -442,9 +435,10 @@ def mode_OpenBeamPath(md=None):
         # laser.enable,  0,
     )
 
-    if not confirm_instrument_mode("out of beam"):
-        mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
-        logger.debug(f"Found UsaxsSaxsMode = {mode_now}")
+    if force or not confirm_instrument_mode("out of beam"):
+        if logger.isEnabledFor(logging.DEBUG):
+            mode_now = terms.SAXS.UsaxsSaxsMode.get(as_string=True)
+            logger.debug("Found UsaxsSaxsMode = %s", mode_now)
         logger.info("Opening the beam path, moving all components out")
         yield from move_SAXSOut()
         yield from move_WAXSOut()
@@ -3,15 +3,18 @@ move the parts of the instrument in and out
 """
 
 import logging
+import math
 
 from apsbits.core.instrument_init import oregistry
-from apsbits.utils.config_loaders import get_config
 from bluesky import plan_stubs as bps
-from ophyd.scaler import ScalerCH
+
+from ..utils.ca_reads import read_many
+from ..utils.ca_reads import read_targets
 
 logger = logging.getLogger(__name__)
 
 MASTER_TIMEOUT = 60
+POSITION_TOLERANCE = 0.001  # already at target if this close (mm)
 # # Device instances
 terms = oregistry["terms"]
 usaxs_shutter = oregistry["usaxs_shutter"]
@@ -24,13 +27,6 @@ a_stage = oregistry["a_stage"]
 d_stage = oregistry["d_stage"]
 gslit_stage = oregistry["gslit_stage"]
 
-iconfig = get_config()
-scaler0_name = iconfig.get("SCALER_PV_NAMES", {}).get("SCALER0_NAME")
-
-scaler0 = ScalerCH(scaler0_name, name="scaler0")
-scaler0.stage_sigs["count_mode"] = "OneShot"
-scaler0.select_channels()
-
 UsaxsSaxsModes = {
     "dirty": -1,  # moving or prior move did not finish correctly
     "out of beam": 1,  # SAXS, WAXS, and USAXS out of beam
@@ -40,19 +36,44 @@ UsaxsSaxsModes = {
     "Imaging in": 5,
     "Imaging tuning": 6,
 }
+_MODE_BY_VALUE = {v: k for k, v in UsaxsSaxsModes.items()}
+
+# (positioner, terms signal with its target) for each move into the beam
+_WAXS_IN = (
+    (guard_slit.v_size, terms.SAXS.guard_v_size),
+    (guard_slit.h_size, terms.SAXS.guard_h_size),
+    (waxsx, terms.WAXS.x_in),
+    (usaxs_slit.v_size, terms.SAXS.v_size),
+    (usaxs_slit.h_size, terms.SAXS.h_size),
+)
+_SAXS_IN_SLITS = (
+    (guard_slit.v_size, terms.SAXS.guard_v_size),
+    (guard_slit.h_size, terms.SAXS.guard_h_size),
+    (usaxs_slit.v_size, terms.SAXS.v_size),
+    (usaxs_slit.h_size, terms.SAXS.h_size),
+)
+_USAXS_IN = (
+    (guard_slit.h_size, terms.USAXS.guard_h_size),
+    (guard_slit.v_size, terms.USAXS.guard_v_size),
+    (usaxs_slit.h_size, terms.USAXS.usaxs_h_size),
+    (usaxs_slit.v_size, terms.USAXS.usaxs_v_size),
+    (a_stage.y, terms.USAXS.ay_in),
+    (a_stage.x, terms.USAXS.AX0),
+    (d_stage.y, terms.USAXS.dy_in),
+    (d_stage.x, terms.USAXS.DX0),  # same as: terms.USAXS:Diode_dx
+    (gslit_stage.x, terms.USAXS.AX0),  # this requires AX0 and Gslits.X be the same.
+)
 
 
 def confirmUsaxsSaxsOutOfBeam():
     """
     Raise ValueError if not out of beam.
     """
-    actual = terms.SAXS.UsaxsSaxsMode.get(
-        timeout=60, as_string=False, use_monitor=False
-    )
+    # monitored: every move_* plan writes the mode with put_complete
+    actual = terms.SAXS.UsaxsSaxsMode.get(as_string=False)
     expected = UsaxsSaxsModes["out of beam"]
     if actual != expected:
-        xref = {v: k for k, v in UsaxsSaxsModes.items()}
-        actual_str = xref.get(actual, "undefined")
+        actual_str = _MODE_BY_VALUE.get(actual, "undefined")
         logger.warning("Found UsaxsSaxsMode = %s (%s)", actual, actual_str)
         raise ValueError(
             f"Incorrect UsaxsSaxsMode mode found ({actual}, {actual_str})."
@@ -61,21 +82,45 @@ def confirmUsaxsSaxsOutOfBeam():
         )
 
 
+def _already_in_mode(mode_name, *args):
+    """
+    True if ``UsaxsSaxsMode`` is ``mode_name`` and nothing needs to move.
+
+    ``args`` are (object, target, object, target, ...) as for ``bps.mv()``.
+    Positioners are compared by ``.position``, signals (such as the guard
+    slit sizes) by ``.get()``.
+    """
+    if terms.SAXS.UsaxsSaxsMode.get() != UsaxsSaxsModes[mode_name]:
+        return False
+    for obj, target in zip(args[0::2], args[1::2]):
+        now = obj.position if hasattr(obj, "position") else obj.get()
+        if not math.isclose(now, target, abs_tol=POSITION_TOLERANCE):
+            return False
+    return True
+
+
 def move_WAXSOut():
     """
     Move WAXS out of beam.
     """
+    x_out = terms.WAXS.x_out.get()
+    if _already_in_mode("out of beam", waxsx, x_out):
+        logger.debug("WAXS is already out of beam")
+        return
+
+    # logger.info("Moving WAXS out of beam")
+    # in case there is an error in moving, it is NOT SAFE to start a scan
     yield from bps.mv(
+        # fmt: off
         usaxs_shutter,
         "close",
+        terms.SAXS.UsaxsSaxsMode,
+        UsaxsSaxsModes["dirty"],
+        # fmt: on
     )
 
-    # logger.info("Moving WAXS out of beam")
-    # in case there is an error in moving, it is NOT SAFE to start a scan
-    yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["dirty"])
-
     # move the WAXS X away from sample
-    yield from bps.mv(waxsx, terms.WAXS.x_out.get())
+    yield from bps.mv(waxsx, x_out)
 
     # logger.info("Removed WAXS from beam position")
     yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["out of beam"])
@@ -85,35 +130,28 @@ def move_WAXSIn():
     """
     Move WAXS into beam.
     """
-    yield from bps.mv(
-        usaxs_shutter,
-        "close",
-    )
+    moves = read_targets(_WAXS_IN)
+    if _already_in_mode("WAXS in beam", *moves):
+        logger.debug("WAXS is already in position")
+        return
 
     logger.debug("Moving to WAXS mode")
 
     confirmUsaxsSaxsOutOfBeam()
 
     # in case there is an error in moving, it is NOT SAFE to start a scan
-    yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["dirty"])
-
-    # first move USAXS out of way
     yield from bps.mv(
         # fmt: off
-        guard_slit.v_size,
-        terms.SAXS.guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.guard_h_size.get(),
-        waxsx,
-        terms.WAXS.x_in.get(),
-        usaxs_slit.v_size,
-        terms.SAXS.v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.h_size.get(),
-        timeout=MASTER_TIMEOUT,
+        usaxs_shutter,
+        "close",
+        terms.SAXS.UsaxsSaxsMode,
+        UsaxsSaxsModes["dirty"],
         # fmt: on
     )
 
+    # first move USAXS out of way
+    yield from bps.mv(*moves, timeout=MASTER_TIMEOUT)
+
     logger.debug("WAXS is in position")
     yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["WAXS in beam"])
 
@@ -122,20 +160,27 @@ def move_SAXSOut():
     """
     Move SAXS out of beam.
     """
+    z_out, y_out = read_many([terms.SAXS.z_out, terms.SAXS.y_out])
+    if _already_in_mode("out of beam", saxs_stage.z, z_out, saxs_stage.y, y_out):
+        logger.debug("SAXS is already out of beam")
+        return
+
+    # logger.info("Moving SAXS out of beam")
+    # in case there is an error in moving, it is NOT SAFE to start a scan
     yield from bps.mv(
+        # fmt: off
         usaxs_shutter,
         "close",
+        terms.SAXS.UsaxsSaxsMode,
+        UsaxsSaxsModes["dirty"],
+        # fmt: on
     )
 
-    # logger.info("Moving SAXS out of beam")
-    # in case there is an error in moving, it is NOT SAFE to start a scan
-    yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["dirty"])
-
     # move the pin_z away from sample
-    yield from bps.mv(saxs_stage.z, terms.SAXS.z_out.get())
+    yield from bps.mv(saxs_stage.z, z_out)
 
     # move pinhole up to out of beam position
-    yield from bps.mv(saxs_stage.y, terms.SAXS.y_out.get())
+    yield from bps.mv(saxs_stage.y, y_out)
 
     # logger.info("Removed SAXS from beam position")
     yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["out of beam"])
@@ -145,45 +190,38 @@ def move_SAXSIn():
     """
     Move SAXS into beam.
     """
-    yield from bps.mv(
-        # fmt: off
-        usaxs_shutter,
-        "close",
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
+    slit_moves = read_targets(_SAXS_IN_SLITS)
+    y_in, z_in = read_many([terms.SAXS.y_in, terms.SAXS.z_in])
+    if _already_in_mode(
+        "SAXS in beam", *slit_moves, saxs_stage.y, y_in, saxs_stage.z, z_in
+    ):
+        logger.debug("SAXS is already in position")
+        return
 
     logger.debug("Moving to SAXS mode")
 
     confirmUsaxsSaxsOutOfBeam()
 
     # in case there is an error in moving, it is NOT SAFE to start a scan
-    yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["dirty"])
-
-    # move SAXS in place, in two steps to prevent possible damage to snout
     yield from bps.mv(
         # fmt: off
-        guard_slit.v_size,
-        terms.SAXS.guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.guard_h_size.get(),
-        saxs_stage.y,
-        terms.SAXS.y_in.get(),
-        usaxs_slit.v_size,
-        terms.SAXS.v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.h_size.get(),
+        usaxs_shutter,
+        "close",
+        terms.SAXS.UsaxsSaxsMode,
+        UsaxsSaxsModes["dirty"],
         timeout=MASTER_TIMEOUT,
         # fmt: on
     )
 
-    yield from bps.mv(
-        # fmt: off
-        saxs_stage.z,
-        terms.SAXS.z_in.get(),
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
+    # start the slits, they need not finish before the SAXS stage moves
+    group = "move_SAXSIn"
+    for obj, value in zip(slit_moves[0::2], slit_moves[1::2]):
+        yield from bps.abs_set(obj, value, group=group, timeout=MASTER_TIMEOUT)
+
+    # move SAXS in place, in two steps to prevent possible damage to snout
+    yield from bps.mv(saxs_stage.y, y_in, timeout=MASTER_TIMEOUT)
+    yield from bps.mv(saxs_stage.z, z_in, timeout=MASTER_TIMEOUT)
+    yield from bps.wait(group=group)
     logger.debug("SAXS is in position")
     yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["SAXS in beam"])
 
@@ -192,22 +230,29 @@ def move_USAXSOut():
     """
     Move USAXS out of beam.
     """
+    ax_out, dx_out = read_many([terms.SAXS.ax_out, terms.SAXS.dx_out])
+    if _already_in_mode("out of beam", a_stage.x, ax_out, d_stage.x, dx_out):
+        logger.debug("USAXS is already out of beam")
+        return
+
+    # logger.info("Moving USAXS out of beam")
+    # in case there is an error in moving, it is NOT SAFE to start a scan
     yield from bps.mv(
+        # fmt: off
         usaxs_shutter,
         "close",
+        terms.SAXS.UsaxsSaxsMode,
+        UsaxsSaxsModes["dirty"],
+        # fmt: on
     )
 
-    # logger.info("Moving USAXS out of beam")
-    # in case there is an error in moving, it is NOT SAFE to start a scan
-    yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["dirty"])
-
     # move the USAXS X away from sample
     yield from bps.mv(
         # fmt: off
         a_stage.x,
-        terms.SAXS.ax_out.get(),
+        ax_out,
         d_stage.x,
-        terms.SAXS.dx_out.get(),
+        dx_out,
         timeout=MASTER_TIMEOUT,
         # fmt: on
     )
@@ -220,42 +265,27 @@ def move_USAXSIn():
     """
     Move USAXS into beam.
     """
-    yield from bps.mv(
-        usaxs_shutter,
-        "close",
-    )
+    moves = read_targets(_USAXS_IN)
+    if _already_in_mode("USAXS in beam", *moves):
+        logger.debug("USAXS is already in position")
+        return
 
     logger.debug("Moving to USAXS mode")
 
     confirmUsaxsSaxsOutOfBeam()
 
     # in case there is an error in moving, it is NOT SAFE to start a scan
-    yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["dirty"])
-
-    # move to USAXS size
     yield from bps.mv(
         # fmt: off
-        guard_slit.h_size,
-        terms.USAXS.guard_h_size.get(),
-        guard_slit.v_size,
-        terms.USAXS.guard_v_size.get(),
-        usaxs_slit.h_size,
-        terms.USAXS.usaxs_h_size.get(),
-        usaxs_slit.v_size,
-        terms.USAXS.usaxs_v_size.get(),
-        a_stage.y,
-        terms.USAXS.ay_in.get(),
-        a_stage.x,
-        terms.USAXS.AX0.get(),
-        d_stage.y,
-        terms.USAXS.dy_in.get(),
-        d_stage.x,
-        terms.USAXS.DX0.get(),  # same as: terms.USAXS:Diode_dx.get(),
-        gslit_stage.x,
-        terms.USAXS.AX0.get(),  # this requires AX0 and Gslits.X be the same.
-        timeout=MASTER_TIMEOUT,
+        usaxs_shutter,
+        "close",
+        terms.SAXS.UsaxsSaxsMode,
+        UsaxsSaxsModes["dirty"],
         # fmt: on
     )
 
+    # move to USAXS size
+    yield from bps.mv(*moves, timeout=MASTER_TIMEOUT)
+
     logger.debug("USAXS is in position")
     yield from bps.mv(terms.SAXS.UsaxsSaxsMode, UsaxsSaxsModes["USAXS in beam"])
@@ -50,6 +50,7 @@ def no_run_trigger_and_wait(
 
 def no_run_operation(
     md: Optional[Dict[str, Any]] = None,
+    delay: float = 0.0,
 ):
     """Perform a no-run operation.
 
@@ -60,12 +61,8 @@ def no_run_operation(
     ----------
     md : Optional[Dict[str, Any]], optional
         Metadata dictionary, by default None
-    RE : Optional[Any], optional
-        Bluesky RunEngine instance, by default None
-    bec : Optional[Any], optional
-        Bluesky Live Callbacks instance, by default None
-    specwriter : Optional[Any], optional
-        SPEC file writer instance, by default None
+    delay : float, optional
+        Time (s) to wait after reporting the state, by default 0
 
     Returns
     -------
@@ -83,6 +80,7 @@ def no_run_operation(
     @bpp.run_decorator(md=_md)
     def _inner():
         yield from user_data.set_state_plan("performing no-run operation")
-        yield from bps.sleep(1)  # Simulate operation time
+        if delay > 0:
+            yield from bps.sleep(delay)
 
     return (yield from _inner())
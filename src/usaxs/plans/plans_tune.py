@@ -4,8 +4,6 @@ user-facing scans
 
 import datetime
 import logging
-import time
-from collections import OrderedDict
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -14,6 +12,7 @@ from apsbits.core.instrument_init import oregistry
 from bluesky import plan_stubs as bps
 from bluesky.utils import plan
 
+from ..utils.ca_reads import read_targets
 from .axis_tuning import tune_a2rp
 from .axis_tuning import tune_ar
 from .axis_tuning import tune_mr
@@ -41,27 +40,34 @@ scaler0 = oregistry["scaler0"]
 m_stage = oregistry["m_stage"]
 a_stage = oregistry["a_stage"]
 
-
-# @bpp.suspend_decorator(suspend_FE_shutter)
-# @bpp.suspend_decorator(suspend_BeamInHutch)
-@plan
-def preUSAXStune(md={}):  # noqa: B006
+# (object, terms signal with its target) set before the USAXS tunes
+_TUNE_LOCATION = (
+    (s_stage.x, terms.preUSAXStune.sx),
+    (s_stage.y, terms.preUSAXStune.sy),
+)
+_TUNE_POSITIONS = (
+    (d_stage.x, terms.USAXS.DX0),
+    (d_stage.y, terms.USAXS.diode.dy),
+    (usaxs_slit.v_size, terms.SAXS.usaxs_v_size),
+    (usaxs_slit.h_size, terms.SAXS.usaxs_h_size),
+    (guard_slit.v_size, terms.SAXS.usaxs_guard_v_size),
+    (guard_slit.h_size, terms.SAXS.usaxs_guard_h_size),
+)
+
+
+def _tune_usaxs_optics(tuners, md):
     """
-    Tune the USAXS optics in any mode, is safe.
+    Plan: move to USAXS mode and run the ``tuners`` in order.
+
+    Shared by ``preUSAXStune()`` and ``allUSAXStune()``.
 
     Parameters
     ----------
-    md : Optional[Dict[str, Any]], optional
-        Metadata dictionary, by default None
-
-    Returns
-    -------
-    Generator[Any, None, None]
-        A generator that yields plan steps
-
-    USAGE:  ``RE(preUSAXStune())``
+    tuners : list of (axis, tune plan)
+        Axes to tune, in order.  An axis may appear more than once.
+    md : Optional[Dict[str, Any]]
+        Metadata dictionary, passed to each tune plan.
     """
-
     yield from MONO_FEEDBACK_ON()
     yield from bps.mv(
         # fmt:off
@@ -76,65 +82,29 @@ def preUSAXStune(md={}):  # noqa: B006
 
     yield from mode_USAXS()
 
+    targets = _TUNE_POSITIONS
     if terms.preUSAXStune.use_specific_location.get() in (1, "yes"):
-        yield from bps.mv(
-            # fmt:off
-            s_stage.x,
-            terms.preUSAXStune.sx.get(),
-            s_stage.y,
-            terms.preUSAXStune.sy.get(),
-            timeout=MASTER_TIMEOUT,
-            # fmt:on
-        )
+        # the sample stage moves along with the diode and slits
+        targets = _TUNE_LOCATION + _TUNE_POSITIONS
 
     yield from bps.mv(
         # fmt:off
-        d_stage.x,
-        terms.USAXS.DX0.get(),
-        d_stage.y,
-        terms.USAXS.diode.dy.get(),
+        *read_targets(targets),
         user_data.time_stamp,
         str(datetime.datetime.now()),
-        usaxs_slit.v_size,
-        terms.SAXS.usaxs_v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.usaxs_h_size.get(),
-        guard_slit.v_size,
-        terms.SAXS.usaxs_guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.usaxs_guard_h_size.get(),
         scaler0.preset_time,
         0.1,
         timeout=MASTER_TIMEOUT,
         # fmt:on
     )
-    yield from user_data.set_state_plan("pre-USAXS optics tune")
+    yield from user_data.set_state_plan("pre-USAXS optics tune", confirm=False)
 
     # when all that is complete, then ...
     yield from bps.mv(usaxs_shutter, "open", timeout=MASTER_TIMEOUT)
 
-    tuners = OrderedDict()  # list the axes to tune
-    # APS-U USAXS does not need tuning M stage too often. Leave to manual staff action
-    # tuners[m_stage.r] = tune_mr            # tune M stage to monochromator
-    if not m_stage.isChannelCut:
-        # tuners[m_stage.r2p] = tune_m2rp  # make M stage crystals parallel
-        pass
-    # if terms.USAXS.useMSstage.get():
-    #    # tuners[ms_stage.rp] = tune_msrp    # align MSR stage with M stage
-    #    pass
-    # if terms.USAXS.useSBUSAXS.get():
-    #    # tuners[as_stage.rp] = tune_asrp
-    #    #     align ASR stage with MSR stage
-    #    #     and set ASRP0 value
-    #    pass
-    # tuners[a_stage.r] = tune_ar  # tune A stage to M stage
-    # tuners[a_stage.r2p] = tune_a2rp  # make A stage crystals parallel
-    tuners[a_stage.r] = tune_ar  # tune A stage to M stage
-    tuners[a_stage.r2p] = tune_a2rp  # make A stage crystals parallel
-
     # now, tune the desired axes, bail out if a tune fails
-    for _axis, tune in tuners.items():
-        yield from bps.mv(usaxs_shutter, "open", timeout=MASTER_TIMEOUT)
+    # each tune plan opens the USAXS shutter itself and closes it when done
+    for _axis, tune in tuners:
         yield from tune(md=md)
         # if not axis.tuner.tune_ok:
         #    logger.warning("!!! tune failed for axis %s !!!", axis.name)
@@ -150,33 +120,33 @@ def preUSAXStune(md={}):  # noqa: B006
         # to complete processing and report back to us.
         yield from bps.sleep(0.5)
 
-    logger.debug("USAXS count time: %s second(s)", terms.USAXS.usaxs_time.get())
+    usaxs_time = terms.USAXS.usaxs_time.get()
+    logger.debug("USAXS count time: %s second(s)", usaxs_time)
+    now = datetime.datetime.now()
     yield from bps.mv(
         # fmt:off
         scaler0.preset_time,
-        terms.USAXS.usaxs_time.get(),
+        usaxs_time,
         user_data.time_stamp,
-        str(datetime.datetime.now()),
+        str(now),
         terms.preUSAXStune.num_scans_last_tune,
         0,
         terms.preUSAXStune.run_tune_next,
         0,
         terms.preUSAXStune.epoch_last_tune,
-        time.time(),
+        now.timestamp(),
         timeout=MASTER_TIMEOUT,
         # fmt:on
     )
-    yield from user_data.set_state_plan("pre-USAXS optics tune")
+    yield from user_data.set_state_plan("pre-USAXS optics tune", confirm=False)
 
 
 # @bpp.suspend_decorator(suspend_FE_shutter)
 # @bpp.suspend_decorator(suspend_BeamInHutch)
 @plan
-def allUSAXStune(
-    md: Optional[Dict[str, Any]] = None,
-):
+def preUSAXStune(md={}):  # noqa: B006
     """
-    Tune mr, ar, a2rp, ar, a2rp USAXS optics.
+    Tune the USAXS optics in any mode, is safe.
 
     Parameters
     ----------
@@ -188,106 +158,65 @@ def allUSAXStune(
     Generator[Any, None, None]
         A generator that yields plan steps
 
-    USAGE:  ``RE(allUSAXStune())``
+    USAGE:  ``RE(preUSAXStune())``
     """
+    tuners = []  # (axis, tune plan) in order
+    # APS-U USAXS does not need tuning M stage too often. Leave to manual staff action
+    # tuners.append((m_stage.r, tune_mr))  # tune M stage to monochromator
+    if not m_stage.isChannelCut:
+        # tuners.append((m_stage.r2p, tune_m2rp))  # make M stage crystals parallel
+        pass
+    # if terms.USAXS.useMSstage.get():
+    #    # tuners.append((ms_stage.rp, tune_msrp))  # align MSR stage with M stage
+    #    pass
+    # if terms.USAXS.useSBUSAXS.get():
+    #    # tuners.append((as_stage.rp, tune_asrp))
+    #    #     align ASR stage with MSR stage
+    #    #     and set ASRP0 value
+    #    pass
+    tuners.append((a_stage.r, tune_ar))  # tune A stage to M stage
+    tuners.append((a_stage.r2p, tune_a2rp))  # make A stage crystals parallel
 
-    yield from MONO_FEEDBACK_ON()
-    yield from bps.mv(
-        mono_shutter,
-        "open",
-        usaxs_shutter,
-        "close",
-        timeout=MASTER_TIMEOUT,
-    )
-    yield from IfRequestedStopBeforeNextScan()  # stop if user chose to do so.
+    yield from _tune_usaxs_optics(tuners, md)
 
-    yield from mode_USAXS()
 
-    if terms.preUSAXStune.use_specific_location.get() in (1, "yes"):
-        yield from bps.mv(
-            s_stage.x,
-            terms.preUSAXStune.sx.get(),
-            s_stage.y,
-            terms.preUSAXStune.sy.get(),
-            timeout=MASTER_TIMEOUT,
-        )
+# @bpp.suspend_decorator(suspend_FE_shutter)
+# @bpp.suspend_decorator(suspend_BeamInHutch)
+@plan
+def allUSAXStune(
+    md: Optional[Dict[str, Any]] = None,
+):
+    """
+    Tune mr, ar, a2rp, ar, a2rp USAXS optics.
 
-    yield from bps.mv(
-        # fmt:off
-        d_stage.x,
-        terms.USAXS.DX0.get(),
-        d_stage.y,
-        terms.USAXS.diode.dy.get(),
-        user_data.time_stamp,
-        str(datetime.datetime.now()),
-        usaxs_slit.v_size,
-        terms.SAXS.usaxs_v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.usaxs_h_size.get(),
-        guard_slit.v_size,
-        terms.SAXS.usaxs_guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.usaxs_guard_h_size.get(),
-        scaler0.preset_time,
-        0.1,
-        timeout=MASTER_TIMEOUT,
-        # fmt:on
-    )
-    yield from user_data.set_state_plan("pre-USAXS optics tune")
+    Parameters
+    ----------
+    md : Optional[Dict[str, Any]], optional
+        Metadata dictionary, by default None
 
-    # when all that is complete, then ...
-    yield from bps.mv(usaxs_shutter, "open", timeout=MASTER_TIMEOUT)
+    Returns
+    -------
+    Generator[Any, None, None]
+        A generator that yields plan steps
 
-    tuners = OrderedDict()  # list the axes to tune
-    tuners[m_stage.r] = tune_mr  # tune M stage to monochromator
+    USAGE:  ``RE(allUSAXStune())``
+    """
+    # (axis, tune plan) in order, an axis may be tuned more than once
+    tuners = [(m_stage.r, tune_mr)]  # tune M stage to monochromator
     # if not m_stage.isChannelCut:
-    #     tuners[m_stage.r2p] = tune_m2rp  # make M stage crystals parallel
+    #     tuners.append((m_stage.r2p, tune_m2rp))  # make M stage crystals parallel
     # if terms.USAXS.useMSstage.get():
-    #    # tuners[ms_stage.rp] = tune_msrp    # align MSR stage with M stage
+    #    # tuners.append((ms_stage.rp, tune_msrp))  # align MSR stage with M stage
     #    pass
     # if terms.USAXS.useSBUSAXS.get():
-    #    # tuners[as_stage.rp] = tune_asrp    # align ASR stage with MSR stage
+    #    # tuners.append((as_stage.rp, tune_asrp))  # align ASR stage with MSR stage
     #    pass
-    tuners[a_stage.r] = tune_ar  # tune A stage to M stage
-    tuners[a_stage.r2p] = tune_a2rp  # make A stage crystals parallel
-    tuners[a_stage.r] = tune_ar  # tune A stage to M stage
-    tuners[a_stage.r2p] = tune_a2rp  # make A stage crystals parallel
+    tuners.append((a_stage.r, tune_ar))  # tune A stage to M stage
+    tuners.append((a_stage.r2p, tune_a2rp))  # make A stage crystals parallel
+    tuners.append((a_stage.r, tune_ar))  # tune A stage to M stage
+    tuners.append((a_stage.r2p, tune_a2rp))  # make A stage crystals parallel
 
-    # now, tune the desired axes, bail out if a tune fails
-    for _axis, tune in tuners.items():
-        yield from bps.mv(usaxs_shutter, "open", timeout=MASTER_TIMEOUT)
-        yield from tune(md=md)
-        # if not axis.tuner.tune_ok:
-        #    logger.warning("!!! tune failed for axis %s !!!", axis.name)
-        # if NOTIFY_ON_BADTUNE:
-        #     email_notices.send(
-        #         f"USAXS tune failed for axis {axis.name}",
-        #         f"USAXS tune failed for axis {axis.name}",
-        #     )
-
-        # If we don't wait, the next tune often fails
-        # intensity stays flat, statistically
-        # We need to wait a short bit to allow EPICS database
-        # to complete processing and report back to us.
-        yield from bps.sleep(0.5)
-
-    logger.debug("USAXS count time: %s second(s)", terms.USAXS.usaxs_time.get())
-    yield from bps.mv(
-        # fmt:off
-        scaler0.preset_time,
-        terms.USAXS.usaxs_time.get(),
-        user_data.time_stamp,
-        str(datetime.datetime.now()),
-        terms.preUSAXStune.num_scans_last_tune,
-        0,
-        terms.preUSAXStune.run_tune_next,
-        0,
-        terms.preUSAXStune.epoch_last_tune,
-        time.time(),
-        timeout=MASTER_TIMEOUT,
-        # fmt:on
-    )
-    yield from user_data.set_state_plan("pre-USAXS optics tune")
+    yield from _tune_usaxs_optics(tuners, md)
 
 
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -300,6 +229,9 @@ def preSWAXStune(
     """
     Tune the SAXS/WAXS optics in any mode, is safe.
 
+    No SAXS/WAXS optics need tuning at present, so this only reports
+    the instrument state.
+
     Parameters
     ----------
     md : Optional[Dict[str, Any]], optional
@@ -312,77 +244,4 @@ def preSWAXStune(
 
     USAGE:  ``RE(preSWAXStune())``
     """
-    if md is None:
-        md = {}
-
-    # yield from MONO_FEEDBACK_ON()
-    # yield from bps.mv(
-    #     mono_shutter,
-    #     "open",
-    #     usaxs_shutter,
-    #     "close",
-    #     timeout=MASTER_TIMEOUT,
-    # )
-    # yield from IfRequestedStopBeforeNextScan()  # stop if user chose to do so.
-
-    # if terms.preUSAXStune.use_specific_location.get() in (1, "yes"):
-    #     yield from bps.mv(
-    #         s_stage.x,
-    #         terms.preUSAXStune.sx.get(),
-    #         s_stage.y,
-    #         terms.preUSAXStune.sy.get(),
-    #         timeout=MASTER_TIMEOUT,
-    #     )
-
-    # yield from bps.mv(
-    #     user_data.time_stamp,
-    #     str(datetime.datetime.now()),
-    #     scaler0.preset_time,
-    #     0.1,
-    #     timeout=MASTER_TIMEOUT,
-    # )
-    # yield from user_data.set_state_plan("pre-SWAXS optics tune")
-
-    # # when all that is complete, then ...
-    # yield from bps.mv(usaxs_shutter, "open", timeout=MASTER_TIMEOUT)
-
-    # # TODO: install suspender using usaxs_CheckBeamStandard.get()
-
-    # tuners = OrderedDict()  # list the axes to tune
-    # tuners[m_stage.r] = tune_mr  # tune M stage to monochromator
-    # # if not m_stage.isChannelCut:
-    # #     tuners[m_stage.r2p] = tune_m2rp  # make M stage crystals parallel
-    # # if terms.USAXS.useMSstage.get():
-    # #     tuners[ms_stage.rp] = tune_msrp  # align MSR stage with M stage
-
-    # # now, tune the desired axes, bail out if a tune fails
-    # #yield from bps.install_suspender(suspend_BeamInHutch)
-    # for axis, tune in tuners.items():
-    #     yield from bps.mv(usaxs_shutter, "open", timeout=MASTER_TIMEOUT)
-    #     yield from tune(md=md)
-    #     # if axis.tuner.tune_ok:
-    #     #     # If we don't wait, the next tune often fails
-    #     #     # intensity stays flat, statistically
-    #     #     # We need to wait a short bit to allow EPICS database
-    #     #     # to complete processing and report back to us.
-    #     #     yield from bps.sleep(1)
-    #     # else:
-    #     #     logger.warning("!!! tune failed for axis %s !!!", axis.name)
-    #     #     # break
-    # #yield from bps.remove_suspender(suspend_BeamInHutch)
-
-    # logger.info("USAXS count time: %s second(s)", terms.USAXS.usaxs_time.get())
-    # yield from bps.mv(
-    #     scaler0.preset_time,
-    #     terms.USAXS.usaxs_time.get(),
-    #     user_data.time_stamp,
-    #     str(datetime.datetime.now()),
-    #     terms.preUSAXStune.num_scans_last_tune,
-    #     0,
-    #     terms.preUSAXStune.run_tune_next,
-    #     0,
-    #     terms.preUSAXStune.epoch_last_tune,
-    #     time.time(),
-    #     timeout=MASTER_TIMEOUT,
-    # )
-    yield from user_data.set_state_plan("pre-SWAXS optics tune")
+    yield from user_data.set_state_plan("pre-SWAXS optics tune", confirm=False)
@@ -5,7 +5,6 @@ user-facing scans
 import datetime
 import logging
 import os
-from collections import OrderedDict
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -27,6 +26,8 @@ from usaxs.utils.utils import techniqueSubdirectory
 from ..startup import RE
 from ..startup import bec
 from ..utils.a2q_q2a import q2angle
+from ..utils.ca_reads import read_many
+from ..utils.ca_reads import read_targets
 from .amplifiers_plan import autoscale_amplifiers
 from .command_list import after_plan
 from .command_list import before_plan
@@ -65,6 +66,149 @@ usaxs_shutter = oregistry["usaxs_shutter"]
 usaxs_slit = oregistry["usaxs_slit"]
 user_data = oregistry["user_data"]
 
+# (slit, terms signal with its size) for USAXS scans
+_USAXS_SLITS = (
+    (usaxs_slit.v_size, terms.SAXS.usaxs_v_size),
+    (usaxs_slit.h_size, terms.SAXS.usaxs_h_size),
+    (guard_slit.v_size, terms.SAXS.usaxs_guard_v_size),
+    (guard_slit.h_size, terms.SAXS.usaxs_guard_h_size),
+)
+
+# (object, value, ...) for bps.mv(): close shutter, scaler back to defaults
+_END_OF_SCAN = (
+    # fmt: off
+    usaxs_shutter, "close",
+    scaler0.update_rate, 5,
+    scaler0.auto_count_delay, 0.25,
+    scaler0.delay, 0.05,
+    scaler0.preset_time, 1,
+    scaler0.auto_count_time, 1,
+    # fmt: on
+)
+
+
+def _prepare_usaxs():
+    """
+    Plan: stop if requested, then put the instrument in USAXS mode.
+
+    The slits are set again from the USAXS sizes in case the user
+    changed them, for example during radiography.
+    """
+    yield from IfRequestedStopBeforeNextScan()
+
+    yield from mode_USAXS()
+
+    yield from bps.mv(*read_targets(_USAXS_SLITS), timeout=MASTER_TIMEOUT)
+
+
+def _start_usaxs(pos_X, pos_Y, thickness, scan_title, md, scan_macro):
+    """
+    Plan: move the sample in, record the scan information and go to Q=0.
+
+    Parameters
+    ----------
+    pos_X, pos_Y : float
+        Sample position for the scan.
+    thickness : float
+        Sample thickness in mm.
+    scan_title : str
+        Title for the scan, before ``getSampleTitle()``.
+    md : Optional[Dict[str, Any]]
+        Metadata dictionary, copied, not modified.
+    scan_macro : str
+        Name written to ``user_data.scan_macro``.
+
+    Returns
+    -------
+    tuple
+        ``(scan_title, _md, ar_center, ax0, dx0)``: the sample title as
+        recorded, the run metadata and the Q=0 positions.
+    """
+    yield from bps.mv(  # sample in place.
+        # fmt: off
+        s_stage.x,
+        pos_X,
+        s_stage.y,
+        pos_Y,
+        timeout=MASTER_TIMEOUT,
+        # fmt: on
+    )
+
+    # Update Sample name. getSampleTitle is used to create proper sample name.
+    # It may add time and temperature therefore it needs to be done close to real
+    # data collection, after mode change and optional tuning.
+    scan_title = getSampleTitle(scan_title)
+    _md = dict(md) if md else {}
+    _md["sample_thickness_mm"] = thickness
+    _md["title"] = scan_title
+
+    # SPEC-compatibility
+    SCAN_N = RE.md["scan_id"] + 1  # update with next number
+
+    # read once, after before_plan() may have re-tuned the center
+    ar_center, ax0, dx0 = read_many(
+        [terms.USAXS.ar_val_center, terms.USAXS.AX0, terms.USAXS.DX0]
+    )
+    ts = str(datetime.datetime.now())
+    yield from bps.mv(  # save scan info, set spec file and move to Q=0, if needed.
+        # fmt: off
+        user_data.sample_title,
+        scan_title,
+        user_data.sample_thickness,
+        thickness,
+        user_data.spec_scan,
+        str(SCAN_N),
+        user_data.time_stamp,
+        ts,
+        user_data.scan_macro,
+        scan_macro,
+        user_data.spec_file,
+        os.path.basename(specwriter.spec_filename),
+        a_stage.r,
+        ar_center,
+        d_stage.x,
+        dx0,
+        a_stage.x,
+        ax0,
+        usaxs_q_calc.channels.B.input_value,
+        ar_center,
+        timeout=MASTER_TIMEOUT,
+        # fmt: on
+    )
+    return scan_title, _md, ar_center, ax0, dx0
+
+
+def _finish_usaxs(gain_up, gain_down, ar_center, ax0, dx0, *args):
+    """
+    Plan: close the shutter and return the USAXS stages to Q=0.
+
+    Parameters
+    ----------
+    gain_up, gain_down : float
+        Femto amplifier gain change limits to restore.
+    ar_center, ax0, dx0 : float
+        Q=0 positions of a_stage.r, a_stage.x and d_stage.x.
+    args
+        More (object, value, ...) pairs to set in the same ``bps.mv()``.
+    """
+    yield from bps.mv(
+        # fmt: off
+        *args,
+        *_END_OF_SCAN,
+        upd_controls.auto.gainU,
+        gain_up,
+        upd_controls.auto.gainD,
+        gain_down,
+        a_stage.r,
+        ar_center,
+        a_stage.x,
+        ax0,
+        d_stage.x,
+        dx0,
+        timeout=MASTER_TIMEOUT,
+        # fmt: on
+    )
+
 
 @bpp.suspend_decorator(suspend_FE_shutter)
 @bpp.suspend_decorator(suspend_BeamInHutch)
@@ -97,12 +241,9 @@ def USAXSscan(
 
     USAGE:  ``RE(USAXSscan(x, y, thickness_mm, title))``
     """
-    if md is None:
-        md = {}
-
     logger.info(f"Collecting USAXS for {title}")
 
-    _md = md or OrderedDict()
+    _md = dict(md) if md else {}
     _md["sample_thickness_mm"] = thickness_mm
     _md["title"] = title
     if terms.FlyScan.use_flyscan.get():
@@ -144,86 +285,16 @@ def USAXSscanStep(
 
     USAGE:  ``RE(USAXSscanStep(pos_X, pos_Y, thickness, scan_title))``
     """
-    if md is None:
-        md = {}
-
-    yield from IfRequestedStopBeforeNextScan()
-
-    yield from mode_USAXS()
-
-    yield from bps.mv(  # this should be just check if user changed slit sizes during
-        # radiography.
-        # fmt: off
-        usaxs_slit.v_size,
-        terms.SAXS.usaxs_v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.usaxs_h_size.get(),
-        guard_slit.v_size,
-        terms.SAXS.usaxs_guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.usaxs_guard_h_size.get(),
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
+    yield from _prepare_usaxs()
     yield from before_plan()  # this will tune if needed.
 
-    yield from bps.mv(  # sample in place.
-        # fmt: off
-        s_stage.x,
-        pos_X,
-        s_stage.y,
-        pos_Y,
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
-
-    # Update Sample name. getSampleTitle is used to create proper sample name.
-    # It may add time and temperature therefore it needs to be done close to real
-    # data collection, after mode change and optional tuning.
-    scan_title = getSampleTitle(scan_title)
-    _md = md or OrderedDict()
-    _md["sample_thickness_mm"] = thickness
-    _md["title"] = scan_title
-
-    scan_title_clean = cleanupText(scan_title)
-
-    # SPEC-compatibility
-    SCAN_N = RE.md["scan_id"] + 1  # update with next number
-
-    ts = str(datetime.datetime.now())
-    yield from bps.mv(
-        # fmt: off
-        user_data.sample_title,
-        scan_title,
-        user_data.sample_thickness,
-        thickness,
-        user_data.spec_scan,
-        str(SCAN_N),
-        user_data.time_stamp,
-        ts,
-        user_data.scan_macro,
-        "uascan",
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
     yield from user_data.set_state_plan("starting USAXS step scan")
     yield from user_data.set_state_plan("Moving to Q=0")
 
-    yield from bps.mv(  # set spec file and move to Q=0 position, if needed.
-        # fmt: off
-        user_data.spec_file,
-        os.path.split(specwriter.spec_filename)[-1],
-        a_stage.r,
-        terms.USAXS.ar_val_center.get(),
-        d_stage.x,
-        terms.USAXS.DX0.get(),
-        a_stage.x,
-        terms.USAXS.AX0.get(),
-        usaxs_q_calc.channels.B.input_value,
-        terms.USAXS.ar_val_center.get(),
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
+    scan_title, _md, ar_center, ax0, dx0 = yield from _start_usaxs(
+        pos_X, pos_Y, thickness, scan_title, md, "uascan"
     )
+    scan_title_clean = cleanupText(scan_title)
 
     yield from measure_USAXS_Transmission()
 
@@ -237,8 +308,9 @@ def USAXSscanStep(
     #         timeout=MASTER_TIMEOUT,
     #     )
 
-    old_femto_change_gain_up = upd_controls.auto.gainU.get()
-    old_femto_change_gain_down = upd_controls.auto.gainD.get()
+    old_femto_change_gain_up, old_femto_change_gain_down = read_many(
+        [upd_controls.auto.gainU, upd_controls.auto.gainD]
+    )
 
     yield from bps.mv(
         # fmt: off
@@ -257,17 +329,7 @@ def USAXSscanStep(
 
     yield from user_data.set_state_plan("Running USAXS step scan")
 
-    # SPEC-compatibility
-    SCAN_N = RE.md["scan_id"] + 1  # update with next number
-    yield from bps.mv(
-        # fmt: off
-        user_data.scanning,
-        "scanning",
-        user_data.spec_scan,
-        str(SCAN_N),
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
+    yield from bps.mv(user_data.scanning, "scanning", timeout=MASTER_TIMEOUT)
 
     _md["plan_name"] = "uascan"
     _md["plan_args"] = dict(
@@ -288,12 +350,30 @@ def USAXSscanStep(
     logger.info("USAXSscan HDF5 data file: %s %s", _md["hdf5_path"], _md["hdf5_file"])
     logger.debug("*" * 10)
 
-    startAngle = terms.USAXS.ar_val_center.get() - q2angle(
-        terms.USAXS.start_offset.get(), monochromator.dcm.wavelength.position
-    )
-    endAngle = terms.USAXS.ar_val_center.get() - q2angle(
-        terms.USAXS.finish.get(), monochromator.dcm.wavelength.position
+    (
+        start_offset,
+        finish,
+        minstep,
+        uaterm,
+        num_points,
+        count_time,
+        sdd,
+        sad,
+    ) = read_many(
+        [
+            terms.USAXS.start_offset,
+            terms.USAXS.finish,
+            terms.USAXS.usaxs_minstep,
+            terms.USAXS.uaterm,
+            terms.USAXS.num_points,
+            terms.USAXS.usaxs_time,
+            terms.USAXS.SDD,
+            terms.USAXS.SAD,
+        ]
     )
+    wavelength = monochromator.dcm.wavelength.position
+    startAngle = ar_center - q2angle(start_offset, wavelength)
+    endAngle = ar_center - q2angle(finish, wavelength)
     bec.disable_plots()
 
     yield from record_sample_image_on_demand("usaxs", scan_title_clean, _md)
@@ -303,16 +383,16 @@ def USAXSscanStep(
     )
     yield from uascan(
         startAngle,
-        terms.USAXS.ar_val_center.get(),
+        ar_center,
         endAngle,
-        terms.USAXS.usaxs_minstep.get(),
-        terms.USAXS.uaterm.get(),
-        terms.USAXS.num_points.get(),
-        terms.USAXS.usaxs_time.get(),
-        terms.USAXS.DX0.get(),
-        terms.USAXS.SDD.get(),
-        terms.USAXS.AX0.get(),
-        terms.USAXS.SAD.get(),
+        minstep,
+        uaterm,
+        num_points,
+        count_time,
+        dx0,
+        sdd,
+        ax0,
+        sad,
         useDynamicTime=use_dynamic_time,
         md=_md,
     )
@@ -322,44 +402,20 @@ def USAXSscanStep(
         # fmt: off
         user_data.scanning,
         "no",
+        terms.FlyScan.order_number,
+        terms.FlyScan.order_number.get() + 1,
         timeout=MASTER_TIMEOUT,
         # fmt: on
     )
 
     yield from user_data.set_state_plan("USAXS step scan finished")
 
-    yield from bps.mvr(terms.FlyScan.order_number, 1)
-
     yield from MONO_FEEDBACK_ON()
 
     yield from user_data.set_state_plan("Moving USAXS back and saving data")
 
-    yield from bps.mv(
-        # fmt: off
-        usaxs_shutter,
-        "close",
-        scaler0.update_rate,
-        5,
-        scaler0.auto_count_delay,
-        0.25,
-        scaler0.delay,
-        0.05,
-        scaler0.preset_time,
-        1,
-        scaler0.auto_count_time,
-        1,
-        upd_controls.auto.gainU,
-        old_femto_change_gain_up,
-        upd_controls.auto.gainD,
-        old_femto_change_gain_down,
-        a_stage.r,
-        terms.USAXS.ar_val_center.get(),
-        a_stage.x,
-        terms.USAXS.AX0.get(),
-        d_stage.x,
-        terms.USAXS.DX0.get(),
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
+    yield from _finish_usaxs(
+        old_femto_change_gain_up, old_femto_change_gain_down, ar_center, ax0, dx0
     )
 
     yield from after_plan(weight=3)
@@ -396,26 +452,7 @@ def Flyscan(
 
     USAGE:  ``RE(Flyscan(pos_X, pos_Y, thickness, scan_title))``
     """
-    if md is None:
-        md = {}
-
-    yield from IfRequestedStopBeforeNextScan()
-
-    yield from mode_USAXS()
-
-    yield from bps.mv(  # make sure slits are correct, inc ase user changed them.
-        # fmt: off
-        usaxs_slit.v_size,
-        terms.SAXS.usaxs_v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.usaxs_h_size.get(),
-        guard_slit.v_size,
-        terms.SAXS.usaxs_guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.usaxs_guard_h_size.get(),
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
+    yield from _prepare_usaxs()
 
     # #verify, that usaxs_minstep is not too small to prevent PSO generator from failing
     # . 0.00002 deg is known minimum
@@ -436,31 +473,20 @@ def Flyscan(
 
     yield from before_plan()
 
-    yield from bps.mv(  # move sample in
-        # fmt: off
-        s_stage.x,
-        pos_X,
-        s_stage.y,
-        pos_Y,
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
+    # yield from user_data.set_state_plan("Moving to Q=0")
+    yield from user_data.set_state_plan("starting USAXS Flyscan")
+
+    scan_title, _md, ar_center, ax0, dx0 = yield from _start_usaxs(
+        pos_X, pos_Y, thickness, scan_title, md, "FlyScan"
     )
 
     # setup names and paths.
-    scan_title = getSampleTitle(scan_title)
-    _md = md or OrderedDict()
-    _md["sample_thickness_mm"] = thickness
-    _md["title"] = scan_title
-
     scan_title_clean = cleanupText(scan_title)
     # print("scan_title_clean:", scan_title_clean)
 
-    # SPEC-compatibility
-    SCAN_N = RE.md["scan_id"] + 1
-
     flyscan_path = techniqueSubdirectory("usaxs")
-    if not os.path.exists(flyscan_path) and RE.state != "idle":
-        os.mkdir(flyscan_path)
+    if RE.state != "idle":
+        os.makedirs(flyscan_path, exist_ok=True)
     flyscan_file_name = (
         f"{scan_title_clean}" f"_{terms.FlyScan.order_number.get():04d}" ".h5"
     )
@@ -471,35 +497,6 @@ def Flyscan(
     logger.info("Flyscan HDF5 data file: %s %s", flyscan_path, flyscan_file_name)
     logger.debug("*" * 10)
 
-    # yield from user_data.set_state_plan("Moving to Q=0")
-    yield from user_data.set_state_plan("starting USAXS Flyscan")
-
-    ts = str(datetime.datetime.now())
-    yield from bps.mv(
-        # fmt: off
-        user_data.sample_title,
-        scan_title,
-        user_data.sample_thickness,
-        thickness,
-        user_data.spec_scan,
-        str(SCAN_N),
-        user_data.time_stamp,
-        ts,
-        user_data.scan_macro,
-        "FlyScan",
-        user_data.spec_file,
-        os.path.split(specwriter.spec_filename)[-1],
-        a_stage.r,
-        terms.USAXS.ar_val_center.get(),
-        d_stage.x,
-        terms.USAXS.DX0.get(),
-        a_stage.x,
-        terms.USAXS.AX0.get(),
-        usaxs_q_calc.channels.B.input_value,
-        terms.USAXS.ar_val_center.get(),
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
     yield from insertScanFilters()  # make sure filters are in place for scan
 
     yield from measure_USAXS_Transmission()
@@ -514,8 +511,9 @@ def Flyscan(
     #         timeout=MASTER_TIMEOUT,
     #     )
 
-    old_femto_change_gain_up = upd_controls.auto.gainU.get()
-    old_femto_change_gain_down = upd_controls.auto.gainD.get()
+    old_femto_change_gain_up, old_femto_change_gain_down = read_many(
+        [upd_controls.auto.gainU, upd_controls.auto.gainD]
+    )
 
     yield from bps.mv(
         # fmt: off
@@ -531,8 +529,23 @@ def Flyscan(
 
     yield from autoscale_amplifiers([upd_controls, I0_controls, I00_controls])
 
+    yield from user_data.set_state_plan("Running Flyscan")
+
+    # start of each trajectory, one read per waveform
+    ar_first, ax_first, dx_first = (
+        traj[0]
+        for traj in read_many(
+            [
+                flyscan_trajectories.ar,
+                flyscan_trajectories.ax,
+                flyscan_trajectories.dx,
+            ]
+        )
+    )
+    scan_time = usaxs_flyscan.scan_time.get()
+
     FlyScanAutoscaleTime = 0.025
-    yield from bps.mv(
+    yield from bps.mv(  # scaler and autosave for the fly scan, stages to the start
         # fmt: off
         scaler0.update_rate,
         0,
@@ -553,41 +566,22 @@ def Flyscan(
         lax_autosave.disable,
         1,
         lax_autosave.max_time,
-        usaxs_flyscan.scan_time.get() + 9,
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
-
-    yield from user_data.set_state_plan("Running Flyscan")
-
-    yield from bps.mv(
-        # fmt: off
+        scan_time + 9,
         a_stage.r,
-        flyscan_trajectories.ar.get()[0],
+        ar_first,
         a_stage.x,
-        flyscan_trajectories.ax.get()[0],
+        ax_first,
         d_stage.x,
-        flyscan_trajectories.dx.get()[0],
+        dx_first,
         ar_start,
-        flyscan_trajectories.ar.get()[0],
-        timeout=MASTER_TIMEOUT,
-        # fmt: on
-    )
-
-    # SPEC-compatibility
-    SCAN_N = RE.md["scan_id"] + 1
-    yield from bps.mv(
-        # fmt: off
+        ar_first,
         user_data.scanning,
         "scanning",
-        user_data.spec_scan,
-        str(SCAN_N),
         timeout=MASTER_TIMEOUT,
         # fmt: on
     )
+
     # save metadata
-    _md = md or OrderedDict()
-    _md.update(md or {})
     _md["plan_name"] = "Flyscan"
     _md["plan_args"] = dict(
         pos_X=pos_X,
@@ -595,7 +589,7 @@ def Flyscan(
         thickness=thickness,
         scan_title=scan_title,
     )
-    _md["fly_scan_time"] = usaxs_flyscan.scan_time.get()
+    _md["fly_scan_time"] = scan_time
 
     yield from record_sample_image_on_demand("usaxs", scan_title_clean, _md)
 
@@ -609,55 +603,34 @@ def Flyscan(
         "no",
         terms.FlyScan.elapsed_time,
         0,
+        terms.FlyScan.order_number,
+        terms.FlyScan.order_number.get() + 1,
         timeout=MASTER_TIMEOUT,
         # fmt: on
     )
 
     diff = flyscan_trajectories.num_pulse_positions.get() - struck.current_channel.get()
     if diff > 5 and RE.state != "idle":
-        msg = "WARNING: Flyscan finished with %g less points" % diff
-        logger.info("*" * 20)
-        logger.info(msg)
-        logger.info("*" * 20)
+        logger.warning("%s Flyscan finished with %g less points", "*" * 20, diff)
         # if NOTIFY_ON_BAD_FLY_SCAN:
         #     subject = "!!! bad number of PSO pulses !!!"
         #     email_notices.send(subject, msg)
 
-    yield from bps.mvr(terms.FlyScan.order_number, 1)
-
     yield from user_data.set_state_plan("Moving USAXS back and saving data")
 
     yield from MONO_FEEDBACK_ON()
 
-    yield from bps.mv(
+    yield from _finish_usaxs(
         # fmt: off
+        old_femto_change_gain_up,
+        old_femto_change_gain_down,
+        ar_center,
+        ax0,
+        dx0,
         lax_autosave.disable,
         0,
         lax_autosave.max_time,
         0,
-        usaxs_shutter,
-        "close",
-        scaler0.update_rate,
-        5,
-        scaler0.auto_count_delay,
-        0.25,
-        scaler0.delay,
-        0.05,
-        scaler0.preset_time,
-        1,
-        scaler0.auto_count_time,
-        1,
-        upd_controls.auto.gainU,
-        old_femto_change_gain_up,
-        upd_controls.auto.gainD,
-        old_femto_change_gain_down,
-        a_stage.r,
-        terms.USAXS.ar_val_center.get(),
-        a_stage.x,
-        terms.USAXS.AX0.get(),
-        d_stage.x,
-        terms.USAXS.DX0.get(),
-        timeout=MASTER_TIMEOUT,
         # fmt: on
     )
 
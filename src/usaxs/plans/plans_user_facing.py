@@ -5,7 +5,6 @@ user-facing scans
 import datetime
 import logging
 import os
-from collections import OrderedDict
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -23,6 +22,8 @@ from usaxs.callbacks.demo_spec_callback import specwriter
 from ..startup import RE
 from ..startup import suspend_BeamInHutch
 from ..startup import suspend_FE_shutter
+from ..utils.ca_reads import read_many
+from ..utils.ca_reads import read_targets
 from ..utils.constants import constants
 from ..utils.override import user_override
 from ..utils.user_sample_title import getSampleTitle
@@ -44,45 +45,41 @@ from .sample_transmission import measure_SAXS_Transmission
 logger = logging.getLogger(__name__)
 
 MASTER_TIMEOUT = 60
-a_stage = oregistry["a_stage"]
-ar_start = oregistry["ar_start"]
-d_stage = oregistry["d_stage"]
-flyscan_trajectories = oregistry["flyscan_trajectories"]
-guard_slit = oregistry["guard_slit"]
 guard_slit = oregistry["guard_slit"]
 I0_controls = oregistry["I0_controls"]
-lax_autosave = oregistry["lax_autosave"]
-m_stage = oregistry["m_stage"]
-mono_shutter = oregistry["mono_shutter"]
 mono_shutter = oregistry["mono_shutter"]
-monochromator = oregistry["monochromator"]
-monochromator = oregistry["monochromator"]
 s_stage = oregistry["s_stage"]
 saxs_det = oregistry["saxs_det"]
 saxs_stage = oregistry["saxs_stage"]
 scaler0 = oregistry["scaler0"]
 scaler1 = oregistry["scaler1"]
-struck = oregistry["struck"]
 terms = oregistry["terms"]
 trd_controls = oregistry["trd_controls"]
-usaxs_flyscan = oregistry["usaxs_flyscan"]
-usaxs_q_calc = oregistry["usaxs_q_calc"]
-usaxs_shutter = oregistry["usaxs_shutter"]
 usaxs_shutter = oregistry["usaxs_shutter"]
 usaxs_slit = oregistry["usaxs_slit"]
 user_data = oregistry["user_data"]
 waxs_det = oregistry["waxs_det"]
 
 AD_FILE_TEMPLATE = "%s%s_%4.4d.hdf"
-LOCAL_FILE_TEMPLATE = "%s_%04d.hdf"
-MASTER_TIMEOUT = 60
 user_override.register("useDynamicTime")
 
+# (slit, terms signal with its size) used for both SAXS and WAXS
+_SLIT_SIZES = (
+    (usaxs_slit.v_size, terms.SAXS.v_size),
+    (usaxs_slit.h_size, terms.SAXS.h_size),
+    (guard_slit.v_size, terms.SAXS.guard_v_size),
+    (guard_slit.h_size, terms.SAXS.guard_h_size),
+)
+
 # Make sure these are not staged. For acquire_time,
 # # any change > 0.001 s takes ~0.5 s for Pilatus to complete!
-DO_NOT_STAGE_THESE_KEYS___THEY_ARE_SET_IN_EPICS = """
-    acquire_time acquire_period num_images num_exposures
-""".split()
+# Removed inside each plan: restorable_stage_sigs() puts them back afterwards.
+DO_NOT_STAGE_THESE_KEYS___THEY_ARE_SET_IN_EPICS = (
+    "acquire_time",
+    "acquire_period",
+    "num_images",
+    "num_exposures",
+)
 
 
 @bpp.suspend_decorator(suspend_FE_shutter)
@@ -118,9 +115,6 @@ def saxsExp(
 
     USAGE:  ``RE(SAXS(pos_X, pos_Y, thickness, scan_title))``
     """
-    if md is None:
-        md = {}
-
     logger.info(f"Starting collection of SAXS for {scan_title}")
 
     yield from IfRequestedStopBeforeNextScan()
@@ -129,19 +123,13 @@ def saxsExp(
 
     yield from mode_SAXS()
 
+    slit_moves = read_targets(_SLIT_SIZES)
     pinz_target = terms.SAXS.z_in.get() + constants["SAXS_PINZ_OFFSET"]
 
     yield from bps.mv(  # move saxs_z out for sample move, other is unimportant check
         # here.
         # fmt: off
-        usaxs_slit.v_size,
-        terms.SAXS.v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.h_size.get(),
-        guard_slit.v_size,
-        terms.SAXS.guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.guard_h_size.get(),
+        *slit_moves,
         saxs_stage.z,
         pinz_target,
         user_data.sample_thickness,
@@ -164,8 +152,7 @@ def saxsExp(
 
     # setup AD names, paths and set metadata
     scan_title = getSampleTitle(scan_title)
-    _md = md or OrderedDict()
-    _md.update(md or {})
+    _md = dict(md) if md else {}
     _md["plan_name"] = "SAXS"
     _md["sample_thickness_mm"] = thickness
     _md["title"] = scan_title
@@ -176,21 +163,14 @@ def saxsExp(
     SCAN_N = RE.md["scan_id"] + 1
 
     ad_file_template = AD_FILE_TEMPLATE
-    local_file_template = LOCAL_FILE_TEMPLATE
 
     SAXSscan_path = techniqueSubdirectory("saxs")
-    SAXS_file_name = local_file_template % (
-        scan_title_clean,
-        saxs_det.hdf1.file_number.get(),
-    )
+    SAXS_file_name = f"{scan_title_clean}_{saxs_det.hdf1.file_number.get():04d}.hdf"
     _md["hdf5_path"] = str(SAXSscan_path)
     _md["hdf5_file"] = str(SAXS_file_name)
 
-    pilatus_path = os.path.join(
-        "/mnt/usaxscontrol", *SAXSscan_path.split(os.path.sep)[2:]
-    )
-    if not pilatus_path.endswith("/"):
-        pilatus_path += "/"
+    # /share1/USAXS_data/... is mounted as /mnt/usaxscontrol/USAXS_data/...
+    pilatus_path = f"/mnt/usaxscontrol/{SAXSscan_path.split(os.path.sep, 2)[2]}/"
     local_name = os.path.join(SAXSscan_path, SAXS_file_name)
     logger.debug(f"SAXS HDF5 file: {local_name}")
     pilatus_name = os.path.join(pilatus_path, SAXS_file_name)
@@ -234,7 +214,7 @@ def saxsExp(
     yield from bps.mv(
         # fmt: off
         user_data.spec_file,
-        os.path.split(specwriter.spec_filename)[-1],
+        os.path.basename(specwriter.spec_filename),
         timeout=MASTER_TIMEOUT,
         # fmt: on
     )
@@ -245,6 +225,9 @@ def saxsExp(
         yield from measure_SAXS_Transmission()
         yield from insertSaxsFilters()
 
+        acquire_time, num_images = read_many(
+            [terms.SAXS.acquire_time, terms.SAXS.num_images]
+        )
         yield from bps.mv(
             # fmt: off
             mono_shutter,
@@ -252,19 +235,18 @@ def saxsExp(
             usaxs_shutter,
             "open",
             saxs_det.cam.num_images,
-            terms.SAXS.num_images.get(),
+            num_images,
             saxs_det.cam.acquire_time,
-            terms.SAXS.acquire_time.get(),
+            acquire_time,
             saxs_det.cam.acquire_period,
-            terms.SAXS.acquire_time.get() + 0.004,
+            acquire_time + 0.004,
             timeout=MASTER_TIMEOUT,
             # fmt: on
         )
         yield from MONO_FEEDBACK_OFF()
 
         for k in DO_NOT_STAGE_THESE_KEYS___THEY_ARE_SET_IN_EPICS:
-            if k in saxs_det.cam.stage_sigs:
-                saxs_det.cam.stage_sigs.pop(k)
+            saxs_det.cam.stage_sigs.pop(k, None)
         saxs_det.hdf1.stage_sigs["file_template"] = ad_file_template
         saxs_det.hdf1.stage_sigs["file_write_mode"] = "Single"
         saxs_det.hdf1.stage_sigs["blocking_callbacks"] = "No"
@@ -280,14 +262,12 @@ def saxsExp(
             # fmt: on
         )
 
-        # SPEC-compatibility
-        SCAN_N = RE.md["scan_id"] + 1
         yield from bps.mv(
             # fmt: off
             scaler1.preset_time,
-            terms.SAXS.acquire_time.get() + 1,
+            acquire_time + 1,
             scaler0.preset_time,
-            1.2 * terms.SAXS.acquire_time.get() + 1,
+            1.2 * acquire_time + 1,
             scaler0.count_mode,
             "OneShot",
             scaler1.count_mode,
@@ -302,13 +282,11 @@ def saxsExp(
             0,
             terms.SAXS_WAXS.start_exposure_time,
             ts,
-            user_data.spec_scan,
-            str(SCAN_N),
             timeout=MASTER_TIMEOUT,
             # fmt: on
         )
         yield from user_data.set_state_plan(
-            f"SAXS collection for {terms.SAXS.acquire_time.get()} s"
+            f"SAXS collection for {acquire_time} s"
         )
 
         yield from record_sample_image_on_demand("saxs", scan_title_clean, _md)
@@ -384,9 +362,6 @@ def waxsExp(
 
     USAGE:  ``RE(WAXS(pos_X, pos_Y, thickness, scan_title))``
     """
-    if md is None:
-        md = {}
-
     logger.info(f"Starting collection of WAXS for {scan_title}")
 
     yield from IfRequestedStopBeforeNextScan()
@@ -396,20 +371,14 @@ def waxsExp(
     yield from mode_WAXS()
 
     # move all in place.
+    slit_moves = read_targets(_SLIT_SIZES)
     yield from bps.mv(
         # fmt: off
         s_stage.x,
         pos_X,
         s_stage.y,
         pos_Y,
-        usaxs_slit.v_size,
-        terms.SAXS.v_size.get(),
-        usaxs_slit.h_size,
-        terms.SAXS.h_size.get(),
-        guard_slit.v_size,
-        terms.SAXS.guard_v_size.get(),
-        guard_slit.h_size,
-        terms.SAXS.guard_h_size.get(),
+        *slit_moves,
         user_data.sample_thickness,
         thickness,
         terms.WAXS.collecting,
@@ -420,7 +389,7 @@ def waxsExp(
 
     # setup names and paths here...
     scan_title = getSampleTitle(scan_title)
-    _md = md or OrderedDict()
+    _md = dict(md) if md else {}
     _md["sample_thickness_mm"] = thickness
     _md["title"] = scan_title
     _md["plan_name"] = "WAXS"
@@ -431,19 +400,14 @@ def waxsExp(
     SCAN_N = RE.md["scan_id"] + 1
 
     ad_file_template = AD_FILE_TEMPLATE
-    local_file_template = LOCAL_FILE_TEMPLATE
 
     WAXSscan_path = techniqueSubdirectory("waxs")
-    WAXS_file_name = local_file_template % (
-        scan_title_clean,
-        waxs_det.hdf1.file_number.get(),
-    )
+    WAXS_file_name = f"{scan_title_clean}_{waxs_det.hdf1.file_number.get():04d}.hdf"
     _md["hdf5_path"] = str(WAXSscan_path)
     _md["hdf5_file"] = str(WAXS_file_name)
 
-    pilatus_path = os.path.join("/mnt/share1", *WAXSscan_path.split(os.path.sep)[2:])
-    if not pilatus_path.endswith("/"):
-        pilatus_path += "/"
+    # /share1/USAXS_data/... is mounted as /mnt/share1/USAXS_data/...
+    pilatus_path = f"/mnt/share1/{WAXSscan_path.split(os.path.sep, 2)[2]}/"
     local_name = os.path.join(WAXSscan_path, WAXS_file_name)
     logger.debug(f"WAXS HDF5 file: {local_name}")
     pilatus_name = os.path.join(pilatus_path, WAXS_file_name)
@@ -486,7 +450,7 @@ def waxsExp(
     yield from bps.mv(
         # fmt: off
         user_data.spec_file,
-        os.path.split(specwriter.spec_filename)[-1],
+        os.path.basename(specwriter.spec_filename),
         timeout=MASTER_TIMEOUT,
         # fmt: on
     )
@@ -496,6 +460,9 @@ def waxsExp(
     def _image_acquisition_steps():
         yield from insertWaxsFilters()
 
+        acquire_time, num_images = read_many(
+            [terms.WAXS.acquire_time, terms.WAXS.num_images]
+        )
         yield from bps.mv(
             # fmt: off
             mono_shutter,
@@ -503,19 +470,18 @@ def waxsExp(
             usaxs_shutter,
             "open",
             waxs_det.cam.num_images,
-            terms.WAXS.num_images.get(),
+            num_images,
             waxs_det.cam.acquire_time,
-            terms.WAXS.acquire_time.get(),
+            acquire_time,
             waxs_det.cam.acquire_period,
-            terms.WAXS.acquire_time.get() + 0.004,
+            acquire_time + 0.004,
             timeout=MASTER_TIMEOUT,
             # fmt: on
         )
         yield from MONO_FEEDBACK_OFF()
 
         for k in DO_NOT_STAGE_THESE_KEYS___THEY_ARE_SET_IN_EPICS:
-            if k in waxs_det.cam.stage_sigs:
-                waxs_det.cam.stage_sigs.pop(k)
+            waxs_det.cam.stage_sigs.pop(k, None)
         waxs_det.hdf1.stage_sigs["file_template"] = ad_file_template
         waxs_det.hdf1.stage_sigs["file_write_mode"] = "Single"
         waxs_det.hdf1.stage_sigs["blocking_callbacks"] = "No"
@@ -534,9 +500,9 @@ def waxsExp(
         yield from bps.mv(
             # fmt: off
             scaler1.preset_time,
-            terms.WAXS.acquire_time.get() + 1,
+            acquire_time + 1,
             scaler0.preset_time,
-            1.2 * terms.WAXS.acquire_time.get() + 1,
+            1.2 * acquire_time + 1,
             scaler0.count_mode,
             "OneShot",
             scaler1.count_mode,
@@ -555,7 +521,7 @@ def waxsExp(
             # fmt: on
         )
         yield from user_data.set_state_plan(
-            f"WAXS collection for {terms.WAXS.acquire_time.get()} s"
+            f"WAXS collection for {acquire_time} s"
         )
 
         yield from record_sample_image_on_demand("waxs", scan_title_clean, _md)
@@ -564,6 +530,15 @@ def waxsExp(
 
     yield from _image_acquisition_steps()
 
+    I0_gated, diode_transmission, diode_gain, I0_transmission, I0_gain = read_many(
+        [
+            scaler1.channels.chan02.s,
+            scaler0.channels.chan05.s,
+            trd_controls.femto.gain,
+            scaler0.channels.chan02.s,
+            I0_controls.femto.gain,
+        ]
+    )
     ts = str(datetime.datetime.now())
     yield from bps.mv(
         # fmt: off
@@ -572,15 +547,15 @@ def waxsExp(
         scaler1.count,
         0,
         terms.SAXS_WAXS.I0_gated,
-        scaler1.channels.chan02.s.get(),
+        I0_gated,
         terms.SAXS_WAXS.diode_transmission,
-        scaler0.channels.chan05.s.get(),
+        diode_transmission,
         terms.SAXS_WAXS.diode_gain,
-        trd_controls.femto.gain.get(),
+        diode_gain,
         terms.SAXS_WAXS.I0_transmission,
-        scaler0.channels.chan02.s.get(),
+        I0_transmission,
         terms.SAXS_WAXS.I0_gain,
-        I0_controls.femto.gain.get(),
+        I0_gain,
         scaler0.update_rate,
         5,
         scaler1.update_rate,
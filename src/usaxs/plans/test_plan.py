@@ -6,7 +6,6 @@ import os
 from collections import OrderedDict
 
 from apsbits.core.instrument_init import oregistry
-from apsbits.utils.config_loaders import get_config
 from apstools.plans import restorable_stage_sigs
 from bluesky import plan_stubs as bps
 from bluesky.utils import plan
@@ -22,11 +21,6 @@ monochromator = oregistry["monochromator"]
 terms = oregistry["terms"]
 I0_controls = oregistry["I0_controls"]
 
-
-iconfig = get_config()
-scaler0_name = iconfig.get("SCALER_PV_NAMES", {}).get("SCALER0_NAME")
-scaler1_name = iconfig.get("SCALER_PV_NAMES", {}).get("SCALER1_NAME")
-
 scaler0 = oregistry["scaler0"]
 scaler1 = oregistry["scaler1"]
 
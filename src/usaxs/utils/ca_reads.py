@@ -0,0 +1,79 @@
+"""
+Read several EPICS signals with one batched Channel Access request.
+"""
+
+import itertools
+import logging
+
+import epics
+
+logger = logging.getLogger(__name__)
+
+CAGET_MANY_TIMEOUT = 5  # seconds
+
+
+def read_many(signals, timeout=CAGET_MANY_TIMEOUT):
+    """
+    Return the values of several ophyd ``EpicsSignal`` objects, in order.
+
+    Signals created with ``auto_monitor=True`` return their monitored
+    value without any network traffic.  The other PVs are read with one
+    ``epics.caget_many()`` call so the requests go out together instead of
+    one round trip per ``.get()``.  A signal that pyepics could not read in
+    the batch is read again with its own ``.get()``, which raises if it
+    really cannot be reached.
+
+    Parameters
+    ----------
+    signals : list of ophyd.EpicsSignal
+        Signals to read.
+    timeout : float, optional
+        Seconds to wait for the batched reads.
+
+    Returns
+    -------
+    list
+        Values in the same order as ``signals``.
+    """
+    signals = list(signals)
+    values = [None] * len(signals)
+    polled = []
+    for i, sig in enumerate(signals):
+        if sig._auto_monitor:  # ophyd keeps this value updated from the monitor
+            values[i] = sig.get()
+        else:
+            polled.append(i)
+
+    if polled:
+        pvnames = [signals[i].pvname for i in polled]
+        for i, value in zip(polled, epics.caget_many(pvnames, timeout=timeout)):
+            values[i] = value
+
+    for i in polled:
+        if values[i] is None:
+            sig = signals[i]
+            logger.debug("caget_many() missed %s, reading it directly", sig.pvname)
+            values[i] = sig.get()
+    return values
+
+
+def read_targets(pairs, timeout=CAGET_MANY_TIMEOUT):
+    """
+    Return (object, target, object, target, ...) for ``bps.mv()``.
+
+    Parameters
+    ----------
+    pairs : sequence of (object, ophyd.EpicsSignal)
+        Each object to move and the signal holding its target.  The
+        signals are read together with :func:`read_many`.
+    timeout : float, optional
+        Seconds to wait for the batched reads.
+
+    Returns
+    -------
+    tuple
+        Objects interleaved with their targets.
+    """
+    objects = [obj for obj, _ in pairs]
+    values = read_many([sig for _, sig in pairs], timeout=timeout)
+    return tuple(itertools.chain.from_iterable(zip(objects, values)))
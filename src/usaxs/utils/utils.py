@@ -9,7 +9,7 @@ from pathlib import Path
 from apsbits.core.instrument_init import oregistry
 
 logger = logging.getLogger(__name__)
-logger.info(__file__)
+logger.bsdev(__file__)
 
 user_data = oregistry["user_data"]
 